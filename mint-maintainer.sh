@@ -29,9 +29,20 @@ fi
 # Save report in current directory
 REPORT_DIR="$(pwd)"
 mkdir -p "$REPORT_DIR"
-TS=$(date +%Y%m%d-%H%M%S)
+printf -v TS '%(%Y%m%d-%H%M%S)T' -1
 REPORT="$REPORT_DIR/system-maintenance-report-$TS.txt"
 
+# Scratch file for command output, created once and reused by run()
+RUN_OUTPUT=$(mktemp)
+REPORT_WRITER_PID=""
+SUDO_KEEPALIVE_PID=""
+trap 'rm -f "$RUN_OUTPUT"; finish_report; stop_sudo_keepalive' EXIT
+
+# Real user and home (not root when using sudo), resolved once per run
+REAL_USER=${SUDO_USER:-${USER:-$(id -un)}}
+REAL_HOME=$(getent passwd "$REAL_USER" | cut -d: -f6)
+REAL_HOME=${REAL_HOME:-$HOME}
+
 # Fixed-width chapter header lines (readable in terminal)
 CH_WIDTH=72
 
@@ -39,9 +50,61 @@ CH_WIDTH=72
 declare -A chapter_status
 declare -A chapter_notes
 declare -A space_changes
+issues=0
 
-# Store initial disk space
-INITIAL_SPACE=$(df -h / | tail -1 | awk '{print $4}')
+# What each chapter does, for the welcome overview (indexed by chapter)
+CHAPTER_PLAN=(
+    ""
+    "Create a Safety Checkpoint"
+    "Update Command-Line Tools (Homebrew)"
+    "Update System Software (APT)"
+    "Check for Package Issues"
+    "Update Desktop Applications (Flatpak)"
+    "Update Snap Applications"
+    "Update Python Tools"
+    "Check Standalone Applications"
+    "Update Device Firmware"
+    "Clean Up Old Log Files"
+    "Remove Old System Kernels"
+    "Check Hard Drive Health"
+    "Update Desktop Extensions"
+    "Clean Up Docker Containers"
+    "Refresh File Search Database"
+    "Deep Clean Temporary Files"
+    "Optimize SSD Performance"
+    "Check System Health"
+    "Check Graphics Card"
+    "Verify Automatic Updates"
+    "Final Summary"
+)
+
+# Short task names for the summary table, indexed by chapter number
+CHAPTER_TASKS=(
+    ""
+    "Safety Checkpoint"
+    "Homebrew Tools"
+    "System Updates"
+    "Package Cleanup"
+    "Flatpak Apps"
+    "Snap Apps"
+    "Python Tools"
+    "AppImage Check"
+    "Firmware Updates"
+    "Log Cleanup"
+    "Kernel Cleanup"
+    "Disk Health"
+    "GNOME Extensions"
+    "Docker Cleanup"
+    "Search Database"
+    "Deep Clean"
+    "SSD Optimization"
+    "System Health"
+    "Graphics Card"
+    "Auto Updates"
+)
+
+# Store initial disk space (whole MB, so differences are plain arithmetic)
+INITIAL_SPACE=$(df -Pm / | awk 'NR==2 {print $4}')
 
 # ------------------------------------------------------------
 # Helpers
@@ -51,35 +114,87 @@ hr() {
     printf "%-${CH_WIDTH}s\n" "" | tr " " "$char"
 }
 
+# Send everything printed from here on to both the terminal and the
+# report through one long-lived tee, instead of a tee per line
+start_report() {
+    exec 3>&1 > >(tee -a "$REPORT")
+    REPORT_WRITER_PID=$!
+}
+
+# Point stdout back at the terminal and wait for the report writer to
+# drain, so the report is complete on disk (safe to call twice)
+finish_report() {
+    if [[ -n "$REPORT_WRITER_PID" ]]; then
+        exec >&3 3>&-
+        wait "$REPORT_WRITER_PID" 2>/dev/null || true
+        REPORT_WRITER_PID=""
+    fi
+}
+
+# Ask for the sudo password once up front and refresh the credential in
+# the background, so long chapters never stop halfway to re-prompt
+start_sudo_keepalive() {
+    if [[ $EUID -eq 0 ]] || ! command -v sudo >/dev/null 2>&1; then
+        return 0
+    fi
+    sudo -v || return 0
+    while kill -0 "$$" 2>/dev/null && sudo -n -v 2>/dev/null; do
+        sleep 60
+    done &
+    SUDO_KEEPALIVE_PID=$!
+}
+
+stop_sudo_keepalive() {
+    if [[ -n "$SUDO_KEEPALIVE_PID" ]]; then
+        kill "$SUDO_KEEPALIVE_PID" 2>/dev/null || true
+        SUDO_KEEPALIVE_PID=""
+    fi
+}
+
 # Friendly narration for non-technical users
 say() {
-    echo -e "$@" | fold -s -w 72 | tee -a "$REPORT"
+    printf '%b\n' "$*" | fold -s -w 72
 }
 
 # Error-aware narration
 error_say() {
-    echo -e "⚠️  $@" | fold -s -w 72 | tee -a "$REPORT"
+    printf '⚠️  %b\n' "$*" | fold -s -w 72
 }
 
 chapter() {
     local num="$1"; shift
-    echo "" | tee -a "$REPORT"
-    echo "# ------------------------------------------------------------" | tee -a "$REPORT"
-    printf "# Chapter %s — %s\n" "$num" "$@" | tee -a "$REPORT"
-    echo "# ------------------------------------------------------------" | tee -a "$REPORT"
-    echo "" | tee -a "$REPORT"
+    local rule="# ------------------------------------------------------------"
+    printf "\n%s\n# Chapter %s — %s\n%s\n\n" "$rule" "$num" "$*" "$rule"
 }
 
-# Calculate space difference
+# Record a chapter's status and keep a running count of issues
+finish_chapter() {
+    local num="$1"
+    if [[ $chapter_success == true ]]; then
+        chapter_status[$num]="✅ Success"
+    else
+        chapter_status[$num]="⚠️ Needs Attention"
+        issues=$((issues + 1))
+    fi
+}
+
+# Free space on / in whole MB
+free_mb() {
+    df -Pm / | awk 'NR==2 {print $4}'
+}
+
+# Size of the systemd journal as journalctl reports it (e.g. "1.2G")
+get_journal_size() {
+    local size
+    size=$(journalctl --disk-usage 2>&1 | grep -oP '\d+\.?\d*[MG]' || true)
+    echo "${size:-unknown}"
+}
+
+# Calculate space difference (both arguments in MB)
 calc_space_diff() {
-    local before="$1"
-    local after="$2"
-    # Convert human-readable to MB
-    local before_mb=$(echo "$before" | \
-        sed 's/G/*1024/; s/M//; s/K/\/1024/' | bc 2>/dev/null || echo 0)
-    local after_mb=$(echo "$after" | \
-        sed 's/G/*1024/; s/M//; s/K/\/1024/' | bc 2>/dev/null || echo 0)
-    echo $((after_mb - before_mb))
+    local before="${1:-0}"
+    local after="${2:-0}"
+    echo $((after - before))
 }
 
 # Run a command with friendly explanation
@@ -94,24 +209,23 @@ run() {
     fi
     
     # Capture space before operation
-    local space_before=$(df -h / | tail -1 | awk '{print $4}')
+    local space_before=$(free_mb)
     
-    # Run command and capture output
-    local output_file=$(mktemp)
-    local error_file=$(mktemp)
+    # Run command: stdout goes to the scratch file, stderr is kept in memory
+    local error_content
     
-    if "$@" >"$output_file" 2>"$error_file"; then
+    if error_content=$("$@" 2>&1 >"$RUN_OUTPUT"); then
         local ec=$?
         # Show relevant output
-        if [[ -s "$output_file" ]]; then
+        if [[ -s "$RUN_OUTPUT" ]]; then
             # Filter and show only important lines
             grep -E "(upgraded|removed|freed|installed|cleaned)" \
-                "$output_file" 2>/dev/null | head -5 | \
-                sed 's/^/   /' | tee -a "$REPORT" || true
+                "$RUN_OUTPUT" 2>/dev/null | head -5 | \
+                sed 's/^/   /' || true
         fi
         
         # Calculate space change
-        local space_after=$(df -h / | tail -1 | awk '{print $4}')
+        local space_after=$(free_mb)
         local space_diff=$(calc_space_diff "$space_before" "$space_after")
         
         if [[ $space_diff -gt 0 ]]; then
@@ -122,15 +236,12 @@ run() {
             say "   ✅ Done! Everything completed successfully."
         fi
         
-        rm -f "$output_file" "$error_file"
         return 0
     else
         local ec=$?
         error_say "Something didn't work as expected. Let me explain:"
         
         # Analyze and explain the error
-        local error_content=$(cat "$error_file" 2>/dev/null || echo "")
-        
         if [[ "$error_content" == *"permission denied"* ]]; then
             error_say "This needs administrator privileges. You might" \
                 "need to enter your password."
@@ -148,14 +259,16 @@ run() {
         fi
         
         # Show first few lines of error
-        head -3 "$error_file" 2>/dev/null | sed 's/^/   /' | \
-            tee -a "$REPORT" || true
+        if [[ -n "$error_content" ]]; then
+            head -3 <<< "$error_content" | sed 's/^/   /' || true
+        fi
         
-        rm -f "$output_file" "$error_file"
         return $ec
     fi
 }
 
+start_sudo_keepalive
+
 # ------------------------------------------------------------
 # Welcome & Introduction
 # ------------------------------------------------------------
@@ -164,7 +277,7 @@ run() {
     echo "============================"
     echo
     echo "Hello! I'm your computer maintenance assistant."
-    echo "Today is $(date '+%A, %B %d, %Y at %I:%M %p')"
+    printf "Today is %(%A, %B %d, %Y at %I:%M %p)T\n" -1
     echo
     echo "I'm going to help keep your computer running smoothly by:"
     echo "• Installing security updates"
@@ -180,32 +293,16 @@ run() {
     echo
     echo "📑 What I'll Do Today:"
     echo "----------------------"
-    echo "1. Create a Safety Checkpoint"
-    echo "2. Update Command-Line Tools (Homebrew)"
-    echo "3. Update System Software (APT)"
-    echo "4. Check for Package Issues"
-    echo "5. Update Desktop Applications (Flatpak)"
-    echo "6. Update Snap Applications"
-    echo "7. Update Python Tools"
-    echo "8. Check Standalone Applications"
-    echo "9. Update Device Firmware"
-    echo "10. Clean Up Old Log Files"
-    echo "11. Remove Old System Kernels"
-    echo "12. Check Hard Drive Health"
-    echo "13. Update Desktop Extensions"
-    echo "14. Clean Up Docker Containers"
-    echo "15. Refresh File Search Database"
-    echo "16. Deep Clean Temporary Files"
-    echo "17. Optimize SSD Performance"
-    echo "18. Check System Health"
-    echo "19. Check Graphics Card"
-    echo "20. Verify Automatic Updates"
-    echo "21. Final Summary"
+    for ((i = 1; i < ${#CHAPTER_PLAN[@]}; i++)); do
+        echo "$i. ${CHAPTER_PLAN[$i]}"
+    done
     echo
     echo "Let's begin! This usually takes 10-30 minutes."
     echo
 } > "$REPORT"
 
+start_report
+
 # ------------------------------------------------------------
 # Chapter 1 — Timeshift Safety Checkpoint
 # ------------------------------------------------------------
@@ -228,7 +325,7 @@ if command -v timeshift >/dev/null 2>&1; then
     # Show relevant parts for debugging
     if [[ $DRY_RUN == true ]]; then
         echo "$ts_list_output" | grep -E "(Backend|Device|Location)" | \
-            sed 's/^/   DEBUG: /' | tee -a "$REPORT" || true
+            sed 's/^/   DEBUG: /' || true
     fi
     
     backend=$(echo "$ts_list_output" | grep -oP 'Backend.*:\s*\K\S+' || \
@@ -254,8 +351,6 @@ if command -v timeshift >/dev/null 2>&1; then
         # Method 2: Check common external drive locations
         if [[ -z "$snapshot_root" ]] || [[ ! -d "$snapshot_root/snapshots" ]]; then
             say "Searching for Timeshift snapshots on external drives..."
-            # Use SUDO_USER if running with sudo
-            REAL_USER=${SUDO_USER:-$USER}
             for mount in /media/$REAL_USER/* /mnt/*; do
                 if [[ -d "$mount/timeshift/snapshots" ]]; then
                     snapshot_root="$mount/timeshift"
@@ -292,11 +387,6 @@ if command -v timeshift >/dev/null 2>&1; then
                 snapshot_name=$(basename "$latest_dir")
                 say "\n✅ Found your latest complete backup: $snapshot_name"
                 
-                # Create human-readable timestamp
-                PRETTY_DATE=$(date '+%A, %B %d, %Y')
-                PRETTY_TIME=$(date '+%I:%M %p')
-                PRETTY_DATETIME=$(date '+%B %d, %Y at %I:%M %p')
-                
                 # Add maintenance note
                 info_json="$latest_dir/info.json"
                 if [[ -f "$info_json" ]]; then
@@ -307,22 +397,31 @@ if command -v timeshift >/dev/null 2>&1; then
                     fi
                     
                     if command -v jq >/dev/null 2>&1; then
-                        # Create detailed maintenance note
-                        MAINT_NOTE="🔧 SYSTEM MAINTENANCE CHECKPOINT"
-                        MAINT_NOTE+="\n━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
-                        MAINT_NOTE+="\n📅 Date: $PRETTY_DATE"
-                        MAINT_NOTE+="\n🕐 Time: $PRETTY_TIME"
-                        MAINT_NOTE+="\n"
-                        MAINT_NOTE+="\n✅ This snapshot was marked before running:"
-                        MAINT_NOTE+="\n   • System updates (APT, Flatpak, Snap)"
-                        MAINT_NOTE+="\n   • Security patches"
-                        MAINT_NOTE+="\n   • Cleanup operations"
-                        MAINT_NOTE+="\n   • Firmware updates"
-                        MAINT_NOTE+="\n"
-                        MAINT_NOTE+="\n💡 Safe to restore if any issues occur after maintenance."
-                        MAINT_NOTE+="\n"
-                        MAINT_NOTE+="\nCreated by: System Maintenance Script"
-                        MAINT_NOTE+="\nTimestamp: $(date '+%Y-%m-%d %H:%M:%S')"
+                        # Human-readable timestamps, only needed for the note
+                        printf -v PRETTY_DATE '%(%A, %B %d, %Y)T' -1
+                        printf -v PRETTY_TIME '%(%I:%M %p)T' -1
+                        printf -v PRETTY_DATETIME '%(%B %d, %Y at %I:%M %p)T' -1
+                        printf -v NOTE_STAMP '%(%Y-%m-%d %H:%M:%S)T' -1
+                        
+                        # Create detailed maintenance note (real newlines,
+                        # so jq stores them as line breaks in the comment)
+                        printf -v MAINT_NOTE '%s\n' \
+                            "🔧 SYSTEM MAINTENANCE CHECKPOINT" \
+                            "━━━━━━━━━━━━━━━━━━━━━━━━━━━━" \
+                            "📅 Date: $PRETTY_DATE" \
+                            "🕐 Time: $PRETTY_TIME" \
+                            "" \
+                            "✅ This snapshot was marked before running:" \
+                            "   • System updates (APT, Flatpak, Snap)" \
+                            "   • Security patches" \
+                            "   • Cleanup operations" \
+                            "   • Firmware updates" \
+                            "" \
+                            "💡 Safe to restore if any issues occur after maintenance." \
+                            "" \
+                            "Created by: System Maintenance Script" \
+                            "Timestamp: $NOTE_STAMP"
+                        MAINT_NOTE=${MAINT_NOTE%$'\n'}
                         
                         if [[ $DRY_RUN == false ]]; then
                             # Show what we're about to do
@@ -352,7 +451,7 @@ if command -v timeshift >/dev/null 2>&1; then
                                     # Show preview of the comment
                                     say "\nPreview of snapshot comment:"
                                     jq -r '.comments' "$info_json" 2>/dev/null | \
-                                        head -5 | sed 's/^/   /' | tee -a "$REPORT" || true
+                                        head -5 | sed 's/^/   /' || true
                                 else
                                     error_say "Failed to update info.json"
                                     chapter_success=false
@@ -364,7 +463,7 @@ if command -v timeshift >/dev/null 2>&1; then
                         else
                             say "(Test mode: Would add this note to snapshot)"
                             echo -e "$MAINT_NOTE" | head -10 | \
-                                sed 's/^/   /' | tee -a "$REPORT"
+                                sed 's/^/   /'
                         fi
                     else
                         error_say "jq is required to add comments. Please install it."
@@ -374,8 +473,7 @@ if command -v timeshift >/dev/null 2>&1; then
                 else
                     error_say "No info.json found in snapshot directory!"
                     say "Contents of $latest_dir:"
-                    ls -la "$latest_dir" | head -5 | sed 's/^/   /' | \
-                        tee -a "$REPORT" || true
+                    ls -la "$latest_dir" | head -5 | sed 's/^/   /' || true
                     chapter_notes[1]="Missing info.json"
                     chapter_success=false
                 fi
@@ -395,7 +493,7 @@ if command -v timeshift >/dev/null 2>&1; then
             # Show what we tried
             say "\nSearched in:"
             say "   • Parsed location: ${snapshot_root:-none}"
-            say "   • External drives: /media/$USER/*"
+            say "   • External drives: /media/$REAL_USER/*"
             say "   • Default: /timeshift"
             
             chapter_notes[1]="Cannot find snapshots"
@@ -410,8 +508,7 @@ else
     chapter_success=false
 fi
 
-chapter_status[1]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 1
 
 # ------------------------------------------------------------
 # Chapter 2 — Homebrew Updates
@@ -425,8 +522,12 @@ say "\n🍺 Homebrew manages special command-line tools that" \
 if command -v brew >/dev/null 2>&1; then
     say "\nLet me check for updates to your command-line tools..."
     
-    run "check for new versions" brew update || \
-        { chapter_success=false; }
+    # brew upgrade refreshes its package list by itself, unless the
+    # user has turned that off
+    if [[ -n "${HOMEBREW_NO_AUTO_UPDATE:-}" ]]; then
+        run "check for new versions" brew update || \
+            { chapter_success=false; }
+    fi
     run "install the updates" brew upgrade || \
         { chapter_success=false; }
     
@@ -437,8 +538,7 @@ else
     chapter_notes[2]="Not installed (optional)"
 fi
 
-chapter_status[2]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 2
 
 # ------------------------------------------------------------
 # Chapter 3 — APT System Updates
@@ -453,7 +553,7 @@ say "\nThis is like getting oil changes for your car - it keeps" \
     "everything running smoothly and safely."
 
 # Pre-update space check
-space_before_apt=$(df -h / | tail -1 | awk '{print $4}')
+space_before_apt=$(free_mb)
 
 run "refresh the list of available updates" \
     sudo apt update || { chapter_success=false; }
@@ -466,18 +566,18 @@ fi
 
 # Show what will be updated
 say "\n📋 Checking what needs updating..."
-update_list=$(apt list --upgradable 2>/dev/null | grep -v "Listing" || true)
-update_count=$(echo "$update_list" | grep -c "upgradable" 2>/dev/null || true)
-update_count=${update_count:-0}
+mapfile -t update_list < <(apt list --upgradable 2>/dev/null | \
+    grep upgradable || true)
+update_count=${#update_list[@]}
 
 if [[ $update_count -gt 0 ]]; then
     say "I found $update_count updates available. Here are some highlights:"
-    echo "$update_list" | head -5 | sed 's/^/   /' | tee -a "$REPORT"
+    printf '   %s\n' "${update_list[@]:0:5}"
     
     if [[ $DRY_RUN == false ]]; then
         # Run the upgrade and capture any errors
         if ! sudo apt -o APT::Get::Always-Include-Phased-Updates=true \
-            --allow-downgrades full-upgrade -y 2>&1 | tee -a "$REPORT"; then
+            --allow-downgrades full-upgrade -y 2>&1; then
             error_say "Some packages couldn't be upgraded."
             say "This is usually fine - they'll update later."
             chapter_success=false
@@ -499,7 +599,7 @@ run "clean up the package download cache" \
     sudo apt clean || { chapter_success=false; }
 
 # Calculate space saved
-space_after_apt=$(df -h / | tail -1 | awk '{print $4}')
+space_after_apt=$(free_mb)
 space_saved=$(calc_space_diff "$space_before_apt" "$space_after_apt")
 
 if [[ $space_saved -gt 0 ]]; then
@@ -509,8 +609,7 @@ else
     chapter_notes[3]="Updated successfully"
 fi
 
-chapter_status[3]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 3
 
 # ------------------------------------------------------------
 # Chapter 4 — Package Sanity Checks
@@ -525,7 +624,7 @@ say "\n🔍 Let me check if any software is being held back or" \
 held_packages=$(apt-mark showhold 2>/dev/null || true)
 if [[ -n "$held_packages" ]]; then
     error_say "These packages are being held back from updates:"
-    echo "$held_packages" | sed 's/^/   /' | tee -a "$REPORT"
+    sed 's/^/   /' <<< "$held_packages"
     say "This might be intentional, but if you don't know why" \
         "they're held, you might want to investigate."
     chapter_notes[4]="Found held packages"
@@ -540,23 +639,19 @@ if ! command -v deborphan >/dev/null 2>&1; then
 fi
 
 if command -v deborphan >/dev/null 2>&1; then
-    orphans=$(deborphan 2>/dev/null || true)
-    if [[ -n "$orphans" ]]; then
-        orphan_count=$(echo "$orphans" | wc -l)
+    mapfile -t orphans < <(deborphan 2>/dev/null || true)
+    if (( ${#orphans[@]} > 0 )); then
+        orphan_count=${#orphans[@]}
         say "\n🧹 Found $orphan_count orphaned packages that" \
             "aren't needed anymore:"
-        echo "$orphans" | head -5 | sed 's/^/   /' | tee -a "$REPORT"
+        printf '   %s\n' "${orphans[@]:0:5}"
         
         if [[ $DRY_RUN == false ]]; then
-            # Remove orphans one by one to avoid xargs issues
+            # One apt transaction for all orphans instead of one per package
             say "\nRemoving orphaned packages..."
-            while IFS= read -r pkg; do
-                if [[ -n "$pkg" ]]; then
-                    run "remove orphaned package: $pkg" \
-                        sudo apt remove -y "$pkg" || \
-                        { chapter_success=false; }
-                fi
-            done <<< "$orphans"
+            run "remove orphaned packages" \
+                sudo apt remove -y "${orphans[@]}" || \
+                { chapter_success=false; }
         fi
         chapter_notes[4]="Cleaned $orphan_count orphans"
     else
@@ -565,8 +660,7 @@ if command -v deborphan >/dev/null 2>&1; then
     fi
 fi
 
-chapter_status[4]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 4
 
 # ------------------------------------------------------------
 # Chapter 5 — Flatpak Applications
@@ -579,7 +673,7 @@ say "\n📱 Flatpak apps are like phone apps - they run in their" \
 
 if command -v flatpak >/dev/null 2>&1; then
     # Check if any remotes are configured
-    remote_count=$(flatpak remote-list 2>/dev/null | wc -l || echo "0")
+    remote_count=$(flatpak remote-list 2>/dev/null | wc -l || true)
     
     if [[ $remote_count -eq 0 ]]; then
         error_say "Flatpak is installed but not set up yet."
@@ -591,8 +685,9 @@ if command -v flatpak >/dev/null 2>&1; then
     else
         say "\n🔄 Updating your Flatpak applications..."
         
-        # Show what's installed
-        app_count=$(flatpak list --app 2>/dev/null | wc -l || echo "0")
+        # Show what's installed (only the app ID column is needed to count)
+        app_count=$(flatpak list --app --columns=application 2>/dev/null | \
+            wc -l || true)
         say "You have $app_count Flatpak apps installed."
         
         run "update all Flatpak apps" flatpak update -y || \
@@ -609,8 +704,7 @@ else
     chapter_notes[5]="Not installed (optional)"
 fi
 
-chapter_status[5]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 5
 
 # ------------------------------------------------------------
 # Chapter 6 — Snap Applications
@@ -644,16 +738,21 @@ if command -v snap >/dev/null 2>&1; then
     old_snaps=$(snap list --all | awk '/disabled/{print $1, $3}')
     
     if [[ -n "$old_snaps" ]]; then
+        would_remove=""
         while read -r name rev; do
             if [[ -n "$name" && -n "$rev" ]]; then
                 if [[ $DRY_RUN == true ]]; then
-                    say "Would remove old version: $name (revision $rev)"
+                    would_remove+="\nWould remove old version: $name"
+                    would_remove+=" (revision $rev)"
                 else
                     sudo snap remove "$name" --revision="$rev" 2>&1 | \
-                        grep -E "(removed|freeing)" | tee -a "$REPORT" || true
+                        grep -E "(removed|freeing)" || true
                 fi
             fi
         done <<< "$old_snaps"
+        if [[ -n "$would_remove" ]]; then
+            say "${would_remove#\\n}"
+        fi
         chapter_notes[6]="Updated & cleaned old versions"
     else
         say "✅ No old versions to clean up."
@@ -665,8 +764,7 @@ else
     chapter_notes[6]="Not installed (optional)"
 fi
 
-chapter_status[6]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 6
 
 # ------------------------------------------------------------
 # Chapter 7 — Python Package Updates
@@ -694,7 +792,9 @@ if command -v pip >/dev/null 2>&1; then
     # For user Python packages, check if they use pipx
     if command -v pipx >/dev/null 2>&1; then
         say "\nChecking pipx-managed Python applications..."
-        pipx_list=$(pipx list 2>/dev/null || true)
+        # --short prints one "name version" line per app, nothing if none;
+        # only whether any exist matters, so keep just the first line
+        pipx_list=$(pipx list --short 2>/dev/null | head -n 1 || true)
         if [[ -n "$pipx_list" ]]; then
             run "upgrade all pipx-managed applications" \
                 pipx upgrade-all || { chapter_success=false; }
@@ -711,8 +811,7 @@ else
     chapter_notes[7]="Not needed"
 fi
 
-chapter_status[7]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 7
 
 # ------------------------------------------------------------
 # Chapter 8 — Standalone Applications Check
@@ -723,9 +822,6 @@ chapter_success=true
 say "\n🎯 Let me check for applications that need manual updates..."
 say "This includes AppImages and applications installed in /opt."
 
-# Get real user home (not root when using sudo)
-REAL_HOME=$(getent passwd ${SUDO_USER:-$USER} | cut -d: -f6)
-
 # First check for AppImages
 say "\n📦 Checking for AppImage applications..."
 search_paths=("$REAL_HOME/Downloads" "$REAL_HOME/.local/bin" \
@@ -734,29 +830,21 @@ search_paths=("$REAL_HOME/Downloads" "$REAL_HOME/.local/bin" \
 # Use null delimiter to handle spaces in filenames
 # Wrap in error handling to ensure script continues
 if mapfile -d '' -t appimages < <(find "${search_paths[@]}" \
-    -maxdepth 3 -type f -name "*.AppImage" -print0 2>/dev/null); then
+    -maxdepth 3 -type f -name "*.AppImage" -print0 2>/dev/null || true); then
     : # Success
 else
     appimages=() # Empty array on error
 fi
 
 if ((${#appimages[@]} > 0)); then
-    say "\n📋 Found ${#appimages[@]} AppImage applications:"
-    # Show up to 10 AppImages
-    count=0
-    for app in "${appimages[@]}"; do
-        if [[ $count -ge 10 ]]; then
-            say "   ... and $((${#appimages[@]} - 10)) more"
-            break
-        fi
-        # Handle empty entries
-        if [[ -z "$app" ]]; then
-            continue
-        fi
-        app_name=$(basename "$app" .AppImage)
-        say "   • $app_name"
-        ((count++)) || true
-    done
+    # Show up to 10 AppImages, by file name without the extension
+    app_names=("${appimages[@]##*/}")
+    app_names=("${app_names[@]%.AppImage}")
+    printf -v app_list '\n   • %s' "${app_names[@]:0:10}"
+    if ((${#appimages[@]} > 10)); then
+        app_list+="\n   ... and $((${#appimages[@]} - 10)) more"
+    fi
+    say "\n📋 Found ${#appimages[@]} AppImage applications:$app_list"
     
     say "\n💡 These apps need to be updated manually by downloading" \
         "new versions from their websites. Consider switching to" \
@@ -772,65 +860,47 @@ fi
 # Now check for other applications in /opt
 say "\n📁 Checking applications in /opt directory..."
 
-# List of known applications that might need updates
+# Known applications that might need updates:
+# "directory in /opt (may be a pattern)|name|how to update"
+opt_known_apps=(
+    "balena-etcher|Balena Etcher|https://etcher.balena.io/"
+    "JDownloader|JDownloader|Check built-in updater or https://jdownloader.org/"
+    "MediaElch|MediaElch|https://www.kvibes.de/mediaelch/download/"
+    "Obsidian|Obsidian|Check in-app updates or https://obsidian.md/"
+    "smartgit|SmartGit|Check Help → Check for Updates"
+    "pdfstudio*|PDF Studio|Check Help menu for updates"
+    "WonderPen|WonderPen|Check in-app updates"
+    "gitkraken|GitKraken|Updates automatically or check Help menu"
+    "docker-desktop|Docker Desktop|Check system tray icon for updates"
+)
+
+# Read /opt once, then match the known applications against it
+opt_dirs=(/opt/*/)
+opt_dirs=("${opt_dirs[@]#/opt/}")
+opt_dirs=("${opt_dirs[@]%/}")
+
 opt_apps=()
 update_instructions=""
-
-# Check each application
-if [[ -d "/opt/balena-etcher" ]]; then
-    opt_apps+=("Balena Etcher")
-    update_instructions+="\n   • Balena Etcher: https://etcher.balena.io/"
-fi
-
-if [[ -d "/opt/JDownloader" ]]; then
-    opt_apps+=("JDownloader")
-    update_instructions+="\n   • JDownloader: Check built-in updater or https://jdownloader.org/"
-fi
-
-if [[ -d "/opt/MediaElch" ]]; then
-    opt_apps+=("MediaElch")
-    update_instructions+="\n   • MediaElch: https://www.kvibes.de/mediaelch/download/"
-fi
-
-if [[ -d "/opt/Obsidian" ]]; then
-    opt_apps+=("Obsidian")
-    update_instructions+="\n   • Obsidian: Check in-app updates or https://obsidian.md/"
-fi
-
-if [[ -d "/opt/smartgit" ]]; then
-    opt_apps+=("SmartGit")
-    update_instructions+="\n   • SmartGit: Check Help → Check for Updates"
-fi
-
-if [[ -d "/opt/pdfstudio"* ]]; then
-    opt_apps+=("PDF Studio")
-    update_instructions+="\n   • PDF Studio: Check Help menu for updates"
-fi
-
-if [[ -d "/opt/WonderPen" ]]; then
-    opt_apps+=("WonderPen")
-    update_instructions+="\n   • WonderPen: Check in-app updates"
-fi
-
-if [[ -d "/opt/gitkraken" ]]; then
-    opt_apps+=("GitKraken")
-    update_instructions+="\n   • GitKraken: Updates automatically or check Help menu"
-fi
-
-if [[ -d "/opt/docker-desktop" ]]; then
-    opt_apps+=("Docker Desktop")
-    update_instructions+="\n   • Docker Desktop: Check system tray icon for updates"
-fi
+for known in "${opt_known_apps[@]}"; do
+    pattern=${known%%|*}
+    app=${known#*|}
+    for dir in "${opt_dirs[@]}"; do
+        # $pattern is unquoted on purpose so "pdfstudio*" matches versions
+        if [[ "$dir" == $pattern ]]; then
+            opt_apps+=("${app%%|*}")
+            update_instructions+="\n   • ${app%%|*}: ${app#*|}"
+            break
+        fi
+    done
+done
 
 # Report findings
 if [[ ${#opt_apps[@]} -gt 0 ]]; then
-    say "\n📋 Found ${#opt_apps[@]} applications in /opt:"
-    for app in "${opt_apps[@]}"; do
-        say "   • $app"
-    done
+    printf -v app_list '\n   • %s' "${opt_apps[@]}"
+    say "\n📋 Found ${#opt_apps[@]} applications in /opt:$app_list"
     
     say "\n💡 Update instructions for these applications:"
-    echo -e "$update_instructions" | tee -a "$REPORT"
+    echo -e "$update_instructions"
     
     say "\n⚠️  These applications typically update through their" \
         "own built-in updaters or need manual downloads."
@@ -840,7 +910,7 @@ else
     chapter_notes[8]="Found ${#appimages[@]} AppImages"
 fi
 
-chapter_status[8]="✅ Success"
+finish_chapter 8
 
 # ------------------------------------------------------------
 # Chapter 9 — Firmware Updates
@@ -852,19 +922,19 @@ say "\n🔧 Firmware is the low-level software that runs your" \
     "hardware devices. Let me check if any updates are available..."
 
 if command -v fwupdmgr >/dev/null 2>&1; then
-    say "\nThis might find updates for:"
-    say "   • Your computer's BIOS/UEFI"
-    say "   • SSD/hard drive firmware"
-    say "   • Thunderbolt controllers"
-    say "   • Other hardware components"
+    printf -v bullets '\n   • %s' "Your computer's BIOS/UEFI" \
+        "SSD/hard drive firmware" "Thunderbolt controllers" \
+        "Other hardware components"
+    say "\nThis might find updates for:$bullets"
     
     run "refresh firmware update list" fwupdmgr refresh || \
         { chapter_success=false; }
     
     # Check for updates
     say "\n🔍 Checking what firmware updates are available..."
-    if fwupdmgr get-updates 2>&1 | tee -a "$REPORT" | \
-        grep -q "No updates available"; then
+    fw_updates=$(fwupdmgr get-updates 2>&1 || true)
+    echo "$fw_updates"
+    if [[ "$fw_updates" == *"No updates available"* ]]; then
         say "✅ All firmware is up to date!"
         chapter_notes[9]="All up to date"
     else
@@ -889,8 +959,7 @@ else
     chapter_success=false
 fi
 
-chapter_status[9]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 9
 
 # ------------------------------------------------------------
 # Chapter 10 — Journal Cleanup
@@ -904,8 +973,7 @@ say "\n📚 Your system keeps detailed logs of everything it does." \
 say "\nLet me clean up logs older than 2 weeks..."
 
 # Check current journal size
-journal_size=$(journalctl --disk-usage 2>&1 | \
-    grep -oP '\d+\.?\d*[MG]' || echo "unknown")
+journal_size=$(get_journal_size)
 say "Current log storage: $journal_size"
 
 run "clean up old system logs (keep 2 weeks)" \
@@ -913,13 +981,11 @@ run "clean up old system logs (keep 2 weeks)" \
     { chapter_success=false; }
 
 # Check new size
-new_journal_size=$(journalctl --disk-usage 2>&1 | \
-    grep -oP '\d+\.?\d*[MG]' || echo "unknown")
+new_journal_size=$(get_journal_size)
 say "Log storage after cleanup: $new_journal_size"
 
 chapter_notes[10]="Cleaned to $new_journal_size"
-chapter_status[10]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 10
 
 # ------------------------------------------------------------
 # Chapter 11 — Old Kernel Cleanup
@@ -939,15 +1005,17 @@ if ! command -v purge-old-kernels >/dev/null 2>&1; then
 fi
 
 # Check current kernels
-kernel_count=$(dpkg -l | grep -c "^ii.*linux-image-[0-9]" || echo "0")
+kernel_count=$(dpkg-query -W -f='${db:Status-Abbrev} ${Package}\n' \
+    'linux-image-[0-9]*' 2>/dev/null | grep -c '^ii' || true)
+kernel_count=${kernel_count:-0}
 say "You currently have $kernel_count kernels installed."
 
 if [[ $kernel_count -gt 2 ]]; then
-    # Check for held kernels
-    held_kernels=$(apt-mark showhold | grep linux-image || true)
+    # Check for held kernels (reuses the hold list from Chapter 4)
+    held_kernels=$(grep '^linux-image' <<< "$held_packages" || true)
     if [[ -n "$held_kernels" ]]; then
         error_say "These kernels are being held:"
-        echo "$held_kernels" | sed 's/^/   /' | tee -a "$REPORT"
+        sed 's/^/   /' <<< "$held_kernels"
     fi
     
     # The correct syntax without --keep for this version
@@ -961,8 +1029,7 @@ else
     chapter_notes[11]="Already clean"
 fi
 
-chapter_status[11]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 11
 
 # ------------------------------------------------------------
 # Chapter 12 — Disk Health Check
@@ -979,24 +1046,27 @@ if ! command -v smartctl >/dev/null 2>&1; then
 fi
 
 if command -v smartctl >/dev/null 2>&1; then
-    # Find all disk devices
+    # Find all physical disks (zram is compressed RAM, not a drive)
     mapfile -t disks < <(lsblk -ndo TYPE,NAME | \
-        awk '$1=="disk"{print $2}')
+        awk '$1=="disk" && $2 !~ /^zram/ {print $2}')
     
     if ((${#disks[@]} > 0)); then
         say "\nChecking ${#disks[@]} storage device(s)..."
         
+        # Ask every drive at once under a single sudo; each drive's
+        # answer lands in its own file so results are reported in order
+        smart_dir=$(mktemp -d)
+        sudo bash -c 'dir=$1; shift
+            for disk in "$@"; do
+                smartctl -H "/dev/$disk" > "$dir/$disk" 2>&1 &
+            done
+            wait' _ "$smart_dir" "${disks[@]}" || true
+        
         all_healthy=true
         for disk in "${disks[@]}"; do
-            # Skip zram devices (compressed RAM, not physical disks)
-            if [[ "$disk" == zram* ]]; then
-                continue
-            fi
-            
             say "\n📊 Checking /dev/$disk..."
             
-            if sudo smartctl -H "/dev/$disk" 2>&1 | \
-                grep -q "PASSED"; then
+            if grep -q "PASSED" "$smart_dir/$disk" 2>/dev/null; then
                 say "   ✅ Healthy!"
             else
                 error_say "   ⚠️ This drive may have issues!" \
@@ -1005,6 +1075,7 @@ if command -v smartctl >/dev/null 2>&1; then
                 chapter_success=false
             fi
         done
+        rm -rf "$smart_dir"
         
         if [[ $all_healthy == true ]]; then
             chapter_notes[12]="All drives healthy"
@@ -1021,8 +1092,7 @@ else
     chapter_notes[12]="Tools not available"
 fi
 
-chapter_status[12]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 12
 
 # ------------------------------------------------------------
 # Chapter 13 — GNOME Extensions
@@ -1034,10 +1104,10 @@ say "\n🧩 GNOME extensions customize your desktop experience." \
     "Let me check for updates..."
 
 if command -v gnome-extensions >/dev/null 2>&1; then
-    # List enabled extensions
-    # Count enabled extensions (trim whitespace)
+    # Count enabled extensions (non-empty lines, in a single pass)
     enabled_ext=$(gnome-extensions list --enabled 2>/dev/null | \
-        wc -l | tr -d ' ' || echo "0")
+        grep -c . || true)
+    enabled_ext=${enabled_ext:-0}
     
     if [[ $enabled_ext -gt 0 ]]; then
         say "You have $enabled_ext extensions enabled."
@@ -1058,8 +1128,7 @@ else
     chapter_notes[13]="Not available"
 fi
 
-chapter_status[13]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 13
 
 # ------------------------------------------------------------
 # Chapter 14 — Docker Cleanup
@@ -1071,14 +1140,25 @@ say "\n🐳 Docker is used for running containerized applications." \
     "Let me check if cleanup is needed..."
 
 if command -v docker >/dev/null 2>&1; then
-    # Check if Docker daemon is running
-    if ! docker info >/dev/null 2>&1; then
+    # Check if Docker daemon is running (only asked again after a start)
+    docker_running=false
+    if docker info >/dev/null 2>&1; then
+        docker_running=true
+    else
         # Try to start Docker if not running
         say "\nDocker is installed but not running. Let me start it..."
         if [[ $DRY_RUN == false ]]; then
             if sudo systemctl start docker 2>/dev/null; then
-                say "✅ Docker started successfully!"
                 sleep 2 # Give it time to initialize
+                if docker info >/dev/null 2>&1; then
+                    say "✅ Docker started successfully!"
+                    docker_running=true
+                else
+                    error_say "Docker started, but I can't talk to it." \
+                        "You may need to be in the 'docker' group."
+                    chapter_notes[14]="Docker not reachable"
+                    chapter_success=false
+                fi
             else
                 error_say "Couldn't start Docker. You may need to check it manually."
                 chapter_notes[14]="Docker not running"
@@ -1090,22 +1170,21 @@ if command -v docker >/dev/null 2>&1; then
     fi
     
     # If Docker is running (or we just started it)
-    if docker info >/dev/null 2>&1; then
+    if [[ $docker_running == true ]]; then
         # Show current usage
         say "\n📊 Current Docker disk usage:"
-        docker system df 2>/dev/null | tee -a "$REPORT" || true
+        docker system df 2>/dev/null || true
         
         # Check what would be removed
         say "\n🔍 Checking what can be cleaned up..."
-        say "This would remove:"
-        say "   • All stopped containers"
-        say "   • All networks not used by containers"
-        say "   • All dangling images"
-        say "   • All build cache"
+        printf -v bullets '\n   • %s' "All stopped containers" \
+            "All networks not used by containers" \
+            "All dangling images" "All build cache"
+        say "This would remove:$bullets"
         
         # Count what would be removed
-        stopped_containers=$(docker ps -a -q -f status=exited | wc -l || echo "0")
-        dangling_images=$(docker images -q -f dangling=true | wc -l || echo "0")
+        stopped_containers=$(docker ps -a -q -f status=exited | wc -l || true)
+        dangling_images=$(docker images -q -f dangling=true | wc -l || true)
         
         if [[ $stopped_containers -gt 0 ]] || [[ $dangling_images -gt 0 ]]; then
             say "\n⚠️  Found $stopped_containers stopped containers and" \
@@ -1115,17 +1194,10 @@ if command -v docker >/dev/null 2>&1; then
                 # Safer cleanup - only remove truly unused items
                 say "\nCleaning up safely..."
                 
-                # Remove only stopped containers older than 24h
-                run "remove old stopped containers" \
-                    docker container prune -f --filter "until=24h" || true
-                
-                # Remove only dangling images
-                run "remove unused images" \
-                    docker image prune -f || true
-                
-                # Clean build cache older than 7 days
-                run "clean old build cache" \
-                    docker builder prune -f --filter "until=168h" || true
+                # One prune for stopped containers, unused networks,
+                # dangling images and build cache, all older than 24h
+                run "remove unused Docker data older than a day" \
+                    docker system prune -f --filter "until=24h" || true
             else
                 say "(Test mode: Would clean Docker resources)"
             fi
@@ -1135,7 +1207,7 @@ if command -v docker >/dev/null 2>&1; then
         
         # Show new usage
         say "\n📊 Docker disk usage after cleanup:"
-        docker system df 2>/dev/null | tee -a "$REPORT" || true
+        docker system df 2>/dev/null || true
         
         chapter_notes[14]="Docker cleaned safely"
     fi
@@ -1145,8 +1217,7 @@ else
     chapter_notes[14]="Not installed"
 fi
 
-chapter_status[14]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 14
 
 # ------------------------------------------------------------
 # Chapter 15 — Update File Search Database
@@ -1159,10 +1230,18 @@ say "\n🔍 Your system maintains a database of all files for" \
 
 say "\nThis helps the 'locate' command find files instantly."
 
-# Check if database is recent
-db_file="/var/lib/mlocate/mlocate.db"
-if [[ -f "$db_file" ]]; then
-    db_age_hours=$(( ($(date +%s) - $(stat -c %Y "$db_file")) / 3600 ))
+# Check if database is recent (Ubuntu 24.04 uses plocate, older mlocate)
+db_file=""
+for candidate in /var/lib/plocate/plocate.db /var/lib/mlocate/mlocate.db; do
+    if [[ -f "$candidate" ]]; then
+        db_file="$candidate"
+        break
+    fi
+done
+need_locate_install=false
+if [[ -n "$db_file" ]]; then
+    printf -v now '%(%s)T' -1
+    db_age_hours=$(( (now - $(stat -c %Y "$db_file")) / 3600 ))
     
     if [[ $db_age_hours -lt 24 ]]; then
         say "✅ Database was updated $db_age_hours hours ago." \
@@ -1171,23 +1250,23 @@ if [[ -f "$db_file" ]]; then
     else
         say "Database is $db_age_hours hours old. Updating..."
         
+        say "\n⏱️ Note: This can take a while on large drives" \
+            "with many files (like cloud storage folders)."
+        
         if command -v updatedb >/dev/null 2>&1; then
             run "scan all files and update search database" \
                 sudo updatedb || { chapter_success=false; }
             chapter_notes[15]="Database refreshed"
         else
-            run "install file search tools" \
-                sudo apt install -y mlocate || { chapter_success=false; }
-            run "build initial database" \
-                sudo updatedb || { chapter_success=false; }
-            chapter_notes[15]="Installed and initialized"
+            need_locate_install=true
         fi
-        
-        say "\n⏱️ Note: This can take a while on large drives" \
-            "with many files (like cloud storage folders)."
     fi
 else
     say "No file database found. Installing search tools..."
+    need_locate_install=true
+fi
+
+if [[ $need_locate_install == true ]]; then
     run "install file search tools" \
         sudo apt install -y mlocate || { chapter_success=false; }
     run "build initial database" \
@@ -1195,8 +1274,7 @@ else
     chapter_notes[15]="Installed and initialized"
 fi
 
-chapter_status[15]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 15
 
 # ------------------------------------------------------------
 # Chapter 16 — BleachBit Deep Clean
@@ -1208,16 +1286,40 @@ say "\n🧹 BleachBit is like CCleaner for Linux - it removes" \
     "temporary files, caches, and other junk."
 
 if command -v bleachbit >/dev/null 2>&1; then
-    say "\nThis will clean things like:"
-    say "   • Web browser caches"
-    say "   • Temporary files"
-    say "   • Old logs"
-    say "   • Thumbnail caches"
+    printf -v bullets '\n   • %s' "Web browser caches" "Temporary files" \
+        "Old logs" "Thumbnail caches"
+    say "\nThis will clean things like:$bullets"
+    
+    # Get list of cleaners. Starting BleachBit just for this is slow and
+    # the list only changes with BleachBit itself, so keep it for a week
+    cleaners_cache="${XDG_CACHE_HOME:-$HOME/.cache}/minty-maintenance"
+    cleaners_cache+="/bleachbit-cleaners.txt"
+    cleaners=""
+    if [[ -s "$cleaners_cache" ]]; then
+        printf -v now '%(%s)T' -1
+        cache_written=$(stat -c %Y "$cleaners_cache")
+        # dpkg keeps the package's build time as the file's mtime, so
+        # the ctime is what moves when BleachBit is installed or upgraded
+        bleachbit_changed=$(stat -L -c %Z "$(command -v bleachbit)" \
+            2>/dev/null || echo "$now")
+        if [[ $bleachbit_changed -le $cache_written && \
+            $((now - cache_written)) -lt $((7 * 24 * 3600)) ]]; then
+            cleaners=$(<"$cleaners_cache")
+        fi
+    fi
+    # A blank cache counts as stale too, so a bad listing is retried
+    if [[ -z "${cleaners//[[:space:]]/}" ]]; then
+        # Only a complete listing is worth keeping, and test mode
+        # leaves no files behind
+        if cleaners=$(bleachbit --list-cleaners 2>/dev/null) && \
+            [[ -n "$cleaners" && $DRY_RUN == false ]]; then
+            mkdir -p "${cleaners_cache%/*}" 2>/dev/null || true
+            printf '%s\n' "$cleaners" 2>/dev/null >"$cleaners_cache" || true
+        fi
+    fi
     
-    # Get list of cleaners
     say "\n📋 Available cleaning options:"
-    bleachbit --list-cleaners 2>/dev/null | head -10 | \
-        sed 's/^/   /' | tee -a "$REPORT" || true
+    head -10 <<< "$cleaners" | sed 's/^/   /' || true
     
     # Clean common safe items
     run "perform deep clean (browser cache, temp files, logs)" \
@@ -1234,8 +1336,7 @@ else
     chapter_notes[16]="Not installed (optional)"
 fi
 
-chapter_status[16]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 16
 
 # ------------------------------------------------------------
 # Chapter 17 — SSD Optimization
@@ -1259,8 +1360,7 @@ say "\n💡 Your system should do this automatically weekly," \
     "but running it manually ensures it's done."
 
 chapter_notes[17]="SSDs optimized"
-chapter_status[17]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 17
 
 # ------------------------------------------------------------
 # Chapter 18 — System Health Check
@@ -1279,7 +1379,7 @@ if [[ -z "$failed_services" ]]; then
     chapter_notes[18]="All services healthy"
 else
     error_say "Found some services with issues:"
-    echo "$failed_services" | sed 's/^/   /' | tee -a "$REPORT"
+    echo "$failed_services" | sed 's/^/   /'
     say "\nThese might need attention, but many are not critical."
     chapter_notes[18]="Some service issues"
     chapter_success=false
@@ -1287,18 +1387,16 @@ fi
 
 # Check for critical errors in logs
 say "\n📊 Checking system logs for critical issues..."
-critical_errors=$(journalctl -p 3 -xb --no-pager 2>/dev/null | \
-    tail -5 | grep -v "^--" || true)
+critical_errors=$(journalctl -p 3 -b -n 5 -q --no-pager 2>/dev/null || true)
 
 if [[ -n "$critical_errors" ]]; then
     say "Found some system warnings (most are usually harmless):"
-    echo "$critical_errors" | sed 's/^/   /' | tee -a "$REPORT"
+    echo "$critical_errors" | sed 's/^/   /'
 else
     say "✅ No critical errors in recent logs!"
 fi
 
-chapter_status[18]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 18
 
 # ------------------------------------------------------------
 # Chapter 19 — NVIDIA Graphics Check
@@ -1313,15 +1411,17 @@ if command -v nvidia-smi >/dev/null 2>&1; then
     # Get GPU info
     gpu_info=$(nvidia-smi \
         --query-gpu=driver_version,name,memory.total,temperature.gpu \
-        --format=csv,noheader 2>/dev/null || true)
+        --format=csv,noheader,nounits 2>/dev/null || true)
     
     if [[ -n "$gpu_info" ]]; then
         IFS=',' read -r driver gpu mem temp <<< "$gpu_info"
+        # csv output separates fields with ", "
+        gpu=${gpu# } mem=${mem# } temp=${temp# }
         
         say "\n✅ Graphics card detected!"
         say "   • Card: $gpu"
         say "   • Driver: $driver"
-        say "   • Memory: $mem"
+        say "   • Memory: $mem MiB"
         say "   • Temperature: ${temp}°C"
         
         if [[ ${temp%.*} -gt 80 ]]; then
@@ -1342,8 +1442,7 @@ else
     chapter_success=false
 fi
 
-chapter_status[19]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 19
 
 # ------------------------------------------------------------
 # Chapter 20 — Automatic Updates Check
@@ -1354,11 +1453,13 @@ chapter_success=true
 say "\n🔒 Ubuntu can install security updates automatically" \
     "in the background. Let me check if this is enabled..."
 
-if dpkg -l unattended-upgrades 2>/dev/null | grep -q "^ii"; then
-    # Check if it's enabled
-    auto_enabled=$(apt-config dump 2>/dev/null | \
-        grep -i "APT::Periodic::Unattended-Upgrade" | \
-        grep -oP '"\K[^"]+' || echo "0")
+if [[ "$(dpkg-query -W -f='${Status}' unattended-upgrades 2>/dev/null)" == \
+    "install ok installed" ]]; then
+    # Check if it's enabled (apt-config prints a ready-quoted assignment)
+    auto_enabled=""
+    eval "$(apt-config shell auto_enabled \
+        APT::Periodic::Unattended-Upgrade 2>/dev/null || true)"
+    auto_enabled=${auto_enabled:-0}
     
     if [[ "$auto_enabled" == "1" ]]; then
         say "✅ Automatic security updates are ENABLED!"
@@ -1376,8 +1477,10 @@ if dpkg -l unattended-upgrades 2>/dev/null | grep -q "^ii"; then
     # Show last run time
     last_run="/var/log/unattended-upgrades/unattended-upgrades.log"
     if [[ -f "$last_run" ]]; then
-        last_date=$(tail -n 50 "$last_run" 2>/dev/null | \
-            grep -oP '\d{4}-\d{2}-\d{2}' | tail -1 || echo "unknown")
+        # tac reads the log backwards, so grep stops at the newest date
+        last_date=$(tac "$last_run" 2>/dev/null | \
+            grep -m1 -oP '.*\K\d{4}-\d{2}-\d{2}' || true)
+        last_date=${last_date:-unknown}
         say "Last automatic update check: $last_date"
     fi
 else
@@ -1389,8 +1492,7 @@ else
     chapter_success=false
 fi
 
-chapter_status[20]=$([[ $chapter_success == true ]] && \
-    echo "✅ Success" || echo "⚠️ Needs Attention")
+finish_chapter 20
 
 # ------------------------------------------------------------
 # Chapter 21 — Final Summary
@@ -1399,7 +1501,7 @@ chapter 21 "Maintenance Complete!"
 
 # Calculate total space change
 final_space=$(df -h / | tail -1 | awk '{print $4}')
-total_space_change=$(calc_space_diff "$INITIAL_SPACE" "$final_space")
+total_space_change=$(calc_space_diff "$INITIAL_SPACE" "$(free_mb)")
 
 say "\n🎉 All done! Here's what happened today:"
 say
@@ -1414,37 +1516,14 @@ say
         "------------------------------"
     
     for i in {1..20}; do
-        # Get chapter name
-        case $i in
-            1) task="Safety Checkpoint" ;;
-            2) task="Homebrew Tools" ;;
-            3) task="System Updates" ;;
-            4) task="Package Cleanup" ;;
-            5) task="Flatpak Apps" ;;
-            6) task="Snap Apps" ;;
-            7) task="Python Tools" ;;
-            8) task="AppImage Check" ;;
-            9) task="Firmware Updates" ;;
-            10) task="Log Cleanup" ;;
-            11) task="Kernel Cleanup" ;;
-            12) task="Disk Health" ;;
-            13) task="GNOME Extensions" ;;
-            14) task="Docker Cleanup" ;;
-            15) task="Search Database" ;;
-            16) task="Deep Clean" ;;
-            17) task="SSD Optimization" ;;
-            18) task="System Health" ;;
-            19) task="Graphics Card" ;;
-            20) task="Auto Updates" ;;
-        esac
-        
+        task="${CHAPTER_TASKS[$i]}"
         status="${chapter_status[$i]:-Unknown}"
         notes="${chapter_notes[$i]:-No data}"
         
         printf "%-30s | %-20s | %-30s\n" \
             "$task" "$status" "$notes"
     done
-} | tee -a "$REPORT"
+}
 
 say "\n📊 Space Summary:"
 if [[ $total_space_change -gt 0 ]]; then
@@ -1456,12 +1535,6 @@ else
 fi
 say "   Available space: $final_space"
 
-# Count issues
-issues=0
-for status in "${chapter_status[@]}"; do
-    [[ "$status" == *"Attention"* ]] && ((issues++))
-done
-
 say "\n📋 Overall Assessment:"
 if [[ $issues -eq 0 ]]; then
     say "   🌟 Your system is in excellent shape!"
@@ -1481,18 +1554,25 @@ if [[ -f /var/run/reboot-required ]]; then
     say "   restart to take effect. Please restart soon."
 fi
 
-say "\n💾 This report has been saved to:"
-say "   $REPORT"
-
-say "\n🗓️ When to run maintenance again:"
-say "   • Weekly: For best performance and security"
-say "   • Monthly: Minimum recommended frequency"
-say "   • After major system changes or if issues arise"
+# Closing notes, written as one batch
+printf -v closing '%s\n' \
+    "" \
+    "💾 This report has been saved to:" \
+    "   $REPORT" \
+    "" \
+    "🗓️ When to run maintenance again:" \
+    "   • Weekly: For best performance and security" \
+    "   • Monthly: Minimum recommended frequency" \
+    "   • After major system changes or if issues arise" \
+    "" \
+    "👋 Thank you for maintaining your system!" \
+    "   Your computer appreciates the care!"
+say "${closing%$'\n'}"
 
-say "\n👋 Thank you for maintaining your system!"
-say "   Your computer appreciates the care!"
+chapter_status[21]="✅ Complete"
 
-# Desktop notification
+# Desktop notification, once the report is fully written
+finish_report
 if [[ $DRY_RUN == false ]] && command -v notify-send >/dev/null 2>&1; then
     if [[ $issues -eq 0 ]]; then
         notify-send "✅ Maintenance Complete!" \
@@ -1502,5 +1582,3 @@ if [[ $DRY_RUN == false ]] && command -v notify-send >/dev/null 2>&1; then
             "$issues items need attention. Check report."
     fi
 fi
-
-chapter_status[21]="✅ Complete"